@@ -5,46 +5,155 @@ Processes all 5 experiments × 4 simulation modes = 20 total runs.
 """
 
 import os
-import re
+import csv
+import mmap
+import pickle
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
-def extract_simulation_runtime(model_result_path):
-    """Extract the simulation runtime from model-result.txt"""
-    try:
+SURROGATE_MODES = ['app-surrogate', 'app-net-not-freeze', 'app-net-freeze']
+
+# Parsed model-result.txt files are stored here, keyed by path, mtime and size
+CACHE_DIR = Path('.cache') / 'model_results'
+# Part of every cache key, bump it whenever parsing changes so older entries are not reused
+CACHE_VERSION = 2
+
+# Label printed right before each value we need from model-result.txt, and the text that must follow it
+MODEL_RESULT_LABELS = {
+    'runtime': ('Running Time = ', ' seconds'),
+    'app0_completion': ('App 0: ', ''),
+    'app1_completion': ('App 1: ', '')
+}
+MODEL_RESULT_LABELS_BYTES = {key: (label.encode(), suffix.encode()) for key, (label, suffix) in MODEL_RESULT_LABELS.items()}
+
+# Files larger than this are scanned through mmap instead of being decoded into a str
+MMAP_THRESHOLD = 1024 * 1024
+
+def _is_number_char(c):
+    """Whether c (one character as str or bytes, empty at the end) is in the regex class [\\d.]"""
+    if isinstance(c, str):
+        return c == '.' or c.isdecimal()
+    return c == b'.' or c.isdigit()
+
+def _match_number(content, label, suffix=''):
+    """Find label, a run of digits and dots, then suffix in content (str, bytes or mmap)
+
+    Matches the same text as re.search(label + r'([\\d.]+)' + suffix) and returns (matched, value),
+    where value is None if the matched digits are not a valid number.
+    """
+    start = content.find(label)
+    while start != -1:
+        start += len(label)
+        end = start
+        while _is_number_char(content[end:end + 1]):
+            end += 1
+        if end > start and content[end:end + len(suffix)] == suffix:
+            try:
+                return True, float(content[start:end])
+            except ValueError:
+                return True, None
+        # Label used in some other context, try the next occurrence
+        start = content.find(label, start)
+    return False, None
+
+def _number_after(content, label, suffix=''):
+    """Parse the number between the first occurrence of label and suffix, None if absent"""
+    return _match_number(content, label, suffix)[1]
+
+def parse_model_result_content(content):
+    """Extract the runtime and both app completion times from model-result.txt content (str or bytes-like)"""
+    labels = MODEL_RESULT_LABELS if isinstance(content, str) else MODEL_RESULT_LABELS_BYTES
+    # find() is a plain substring search (memmem), no regex engine involved; each one
+    # stops at the first occurrence, and a crashed run without the labels is rejected quickly
+    return {key: _number_after(content, label, suffix) for key, (label, suffix) in labels.items()}
+
+def parse_model_result_lines(lines):
+    """Extract the runtime and both app completion times line by line, stopping once all are found"""
+    parsed = dict.fromkeys(MODEL_RESULT_LABELS)
+    missing = dict(MODEL_RESULT_LABELS)
+    for line in lines:
+        # Cheap substring gate, only the few candidate lines are parsed
+        if 'Running Time =' not in line and 'App ' not in line:
+            continue
+        for key, (label, suffix) in list(missing.items()):
+            matched, value = _match_number(line, label, suffix)
+            if matched:
+                # Keep the first occurrence of each value
+                parsed[key] = value
+                del missing[key]
+        if not missing:
+            break
+    return parsed
+
+def extract_simulation_runtime(content):
+    """Extract the simulation runtime from model-result.txt content"""
+    return parse_model_result_content(content)['runtime']
+
+def extract_app_completion_times(content):
+    """Extract application completion times from model-result.txt content"""
+    parsed = parse_model_result_content(content)
+    return parsed['app0_completion'], parsed['app1_completion']
+
+def parse_model_result(model_result_path):
+    """Read model-result.txt once and extract the runtime and both app completion times"""
+    if os.stat(model_result_path).st_size <= MMAP_THRESHOLD:
         with open(model_result_path, 'r') as f:
-            content = f.read()
-        
-        # Look for "Running Time = X.XXXX seconds"
-        match = re.search(r'Running Time = ([\d.]+) seconds', content)
-        if match:
-            return float(match.group(1))
-        else:
-            print(f"Warning: Could not find running time in {model_result_path}")
-            return None
-    except Exception as e:
-        print(f"Error reading {model_result_path}: {e}")
-        return None
+            return parse_model_result_lines(f)
+
+    # Large outputs: search the page cache directly, no copy and no decode
+    with open(model_result_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return parse_model_result_content(mm)
+
+def _cache_file(model_result_path):
+    """Location of the cached parse for model-result.txt in its current state"""
+    stat = os.stat(model_result_path)
+    key = f"{CACHE_VERSION}:{Path(model_result_path).resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+    return CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.pkl"
 
-def extract_app_completion_times(model_result_path):
-    """Extract application completion times from model-result.txt"""
+def read_cached_model_result(cache_file):
+    """Return the parse stored in cache_file, or None if it has to be parsed again"""
     try:
-        with open(model_result_path, 'r') as f:
-            content = f.read()
-        
-        # Look for "App 0: XXXXX.XXXX" and "App 1: XXXXX.XXXX"
-        app0_match = re.search(r'App 0: ([\d.]+)', content)
-        app1_match = re.search(r'App 1: ([\d.]+)', content)
-        
-        app0_time = float(app0_match.group(1)) if app0_match else None
-        app1_time = float(app1_match.group(1)) if app1_match else None
-        
-        return app0_time, app1_time
-    except Exception as e:
-        print(f"Error reading {model_result_path}: {e}")
-        return None, None
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (pickle.UnpicklingError, EOFError) as e:
+        print(f"Warning: Ignoring corrupted cache entry {cache_file}: {e}")
+        return None
+
+def parse_and_cache_model_result(model_result_path, cache_file):
+    """Parse model-result.txt and store the result in cache_file
+
+    cache_file must be computed before parsing, so a file that is still growing is never
+    stored under the state it reached after the parse.
+    """
+    parsed = parse_model_result(model_result_path)
+
+    # Write to a temporary file first so concurrent or interrupted runs never leave half-written entries
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        pickle.dump(parsed, f)
+    os.replace(tmp_path, cache_file)
+
+    return parsed
 
-def analyze_all_experiments(base_path):
+def load_model_result(model_result_path, use_cache=True):
+    """Parse model-result.txt, reusing a previous parse if the file has not changed"""
+    if not use_cache:
+        return parse_model_result(model_result_path)
+
+    cache_file = _cache_file(model_result_path)
+    parsed = read_cached_model_result(cache_file)
+    if parsed is not None:
+        return parsed
+    return parse_and_cache_model_result(model_result_path, cache_file)
+
+def analyze_all_experiments(base_path, use_cache=True):
     """Analyze all experiments and return structured data"""
     
     # Define experiment names and simulation modes
@@ -64,43 +173,102 @@ def analyze_all_experiments(base_path):
     ]
     
     results = []
+    # (exp, exp_data, mode, mode_path) for every model-result.txt to load
+    worklist = []
+    
+    # One directory listing per level instead of an exists() probe per experiment and mode.
+    # A missing directory lists as empty, so each experiment or mode in it is reported below.
+    try:
+        with os.scandir(base_path) as it:
+            exp_dirs = {e.name for e in it if e.is_dir()}
+    except (FileNotFoundError, NotADirectoryError):
+        exp_dirs = set()
     
     for exp in experiments:
         exp_path = Path(base_path) / exp
-        if not exp_path.exists():
+        if exp not in exp_dirs:
             print(f"Warning: Experiment {exp} not found at {exp_path}")
             continue
             
         exp_data = {}
+        try:
+            with os.scandir(exp_path) as it:
+                mode_dirs = {e.name for e in it if e.is_dir()}
+        except (FileNotFoundError, NotADirectoryError):
+            # Removed since the experiment listing
+            mode_dirs = set()
         
         for mode in modes:
-            mode_path = exp_path / mode / "model-result.txt"
-            if not mode_path.exists():
+            if mode not in mode_dirs:
                 print(f"Warning: {mode} not found for {exp}")
                 continue
                 
-            # Extract data
-            runtime = extract_simulation_runtime(mode_path)
-            app0_time, app1_time = extract_app_completion_times(mode_path)
-            
-            exp_data[mode] = {
-                'runtime': runtime,
-                'app0_completion': app0_time,
-                'app1_completion': app1_time
-            }
+            worklist.append((exp, exp_data, mode, exp_path / mode / "model-result.txt"))
         
         results.append({
             'experiment': exp,
             'data': exp_data
         })
     
+    # Files are independent and reading them is I/O bound, so parse them concurrently.
+    # Cache hits are resolved up front, a warm run never starts the pool.
+    loaded = {}
+    cache_files = {}
+    if use_cache:
+        for _, _, _, mode_path in worklist:
+            try:
+                cache_files[mode_path] = _cache_file(mode_path)
+            except OSError:
+                # Reported when the pool fails to parse it
+                continue
+            cached = read_cached_model_result(cache_files[mode_path])
+            if cached is not None:
+                loaded[mode_path] = cached
+    
+    to_parse = [mode_path for _, _, _, mode_path in worklist if mode_path not in loaded]
+    futures = {}
+    if to_parse:
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for mode_path in to_parse:
+                if mode_path in cache_files:
+                    futures[mode_path] = executor.submit(parse_and_cache_model_result, mode_path, cache_files[mode_path])
+                else:
+                    futures[mode_path] = executor.submit(parse_model_result, mode_path)
+    
+    # Assemble in worklist order so output stays deterministic
+    for exp, exp_data, mode, mode_path in worklist:
+        try:
+            exp_data[mode] = loaded[mode_path] if mode_path in loaded else futures[mode_path].result()
+            if exp_data[mode]['runtime'] is None:
+                print(f"Warning: Could not find running time in {mode_path}")
+        except FileNotFoundError:
+            # Mode directory exists but the run never produced a result file
+            print(f"Warning: {mode} not found for {exp}")
+        except Exception as e:
+            print(f"Error reading {mode_path}: {e}")
+            exp_data[mode] = {
+                'runtime': None,
+                'app0_completion': None,
+                'app1_completion': None
+            }
+    
     return results
 
+def _to_float_array(values):
+    """Convert a list of optional floats into an array, None becomes NaN"""
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+def _is_valid(values):
+    """Mask of values that are present and non-zero"""
+    return np.isfinite(values) & (values != 0)
+
 def calculate_speedups_and_errors(results):
     """Calculate speedups and application completion errors"""
     
-    speedup_data = []
-    error_data = []
+    # One entry per (experiment, surrogate mode) pair, missing values become NaN
+    exp_names, modes = [], []
+    hf_runtimes, surrogate_runtimes = [], []
+    hf_app_times, surrogate_app_times = [], []
     
     for result in results:
         exp_name = result['experiment']
@@ -110,82 +278,105 @@ def calculate_speedups_and_errors(results):
             print(f"Warning: No high-fidelity data for {exp_name}")
             continue
             
-        hf_runtime = data['high-fidelity']['runtime']
-        hf_app0 = data['high-fidelity']['app0_completion']
-        hf_app1 = data['high-fidelity']['app1_completion']
+        hf_data = data['high-fidelity']
         
-        for mode in ['app-surrogate', 'app-net-not-freeze', 'app-net-freeze']:
+        for mode in SURROGATE_MODES:
             if mode not in data:
                 continue
                 
             mode_data = data[mode]
             
-            # Calculate speedup
-            if hf_runtime and mode_data['runtime']:
-                speedup = hf_runtime / mode_data['runtime']
-                speedup_data.append({
-                    'Experiment': exp_name,
-                    'Mode': mode,
-                    'HF_Runtime_s': hf_runtime,
-                    'Surrogate_Runtime_s': mode_data['runtime'],
-                    'Speedup': speedup
-                })
-            
-            # Calculate application completion errors
-            if hf_app0 and mode_data['app0_completion']:
-                app0_error = ((mode_data['app0_completion'] - hf_app0) / hf_app0) * 100
-                error_data.append({
-                    'Experiment': exp_name,
-                    'Mode': mode,
-                    'Application': 'Jacobi (App 0)',
-                    'HF_Completion_ns': hf_app0,
-                    'Surrogate_Completion_ns': mode_data['app0_completion'],
-                    'Error_Percent': app0_error
-                })
-            
-            if hf_app1 and mode_data['app1_completion']:
-                app1_error = ((mode_data['app1_completion'] - hf_app1) / hf_app1) * 100
-                error_data.append({
-                    'Experiment': exp_name,
-                    'Mode': mode,
-                    'Application': 'MILC (App 1)',
-                    'HF_Completion_ns': hf_app1,
-                    'Surrogate_Completion_ns': mode_data['app1_completion'],
-                    'Error_Percent': app1_error
-                })
-    
-    return speedup_data, error_data
+            exp_names.append(exp_name)
+            modes.append(mode)
+            hf_runtimes.append(hf_data['runtime'])
+            surrogate_runtimes.append(mode_data['runtime'])
+            hf_app_times.extend([hf_data['app0_completion'], hf_data['app1_completion']])
+            surrogate_app_times.extend([mode_data['app0_completion'], mode_data['app1_completion']])
+    
+    exp_names = np.array(exp_names, dtype=object)
+    modes = np.array(modes, dtype=object)
+    hf_runtimes = _to_float_array(hf_runtimes)
+    surrogate_runtimes = _to_float_array(surrogate_runtimes)
+    # Shape (pairs, 2): column 0 is App 0 (Jacobi), column 1 is App 1 (MILC)
+    hf_app_times = _to_float_array(hf_app_times).reshape(-1, 2)
+    surrogate_app_times = _to_float_array(surrogate_app_times).reshape(-1, 2)
+    app_names = np.array(['Jacobi (App 0)', 'MILC (App 1)'], dtype=object)
+    
+    # Pairs with a missing (or zero) value on either side are left out
+    with np.errstate(divide='ignore', invalid='ignore'):
+        speedups = hf_runtimes / surrogate_runtimes
+        errors = ((surrogate_app_times - hf_app_times) / hf_app_times) * 100
+    
+    has_speedup = _is_valid(hf_runtimes) & _is_valid(surrogate_runtimes)
+    speedup_df = pd.DataFrame({
+        'Experiment': exp_names[has_speedup],
+        'Mode': pd.Categorical(modes[has_speedup], categories=SURROGATE_MODES),
+        'HF_Runtime_s': hf_runtimes[has_speedup],
+        'Surrogate_Runtime_s': surrogate_runtimes[has_speedup],
+        'Speedup': speedups[has_speedup]
+    })
+    
+    # nonzero() walks row-major, so rows stay ordered by experiment, mode, then app
+    rows, apps = np.nonzero(_is_valid(hf_app_times) & _is_valid(surrogate_app_times))
+    error_df = pd.DataFrame({
+        'Experiment': exp_names[rows],
+        'Mode': pd.Categorical(modes[rows], categories=SURROGATE_MODES),
+        'Application': app_names[apps],
+        'HF_Completion_ns': hf_app_times[rows, apps],
+        'Surrogate_Completion_ns': surrogate_app_times[rows, apps],
+        'Error_Percent': errors[rows, apps]
+    })
+    
+    return speedup_df, error_df
+
+def write_csv(df, path):
+    """Write a result DataFrame to CSV with the stdlib writer, column by column"""
+    with open(path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile, lineterminator='\n')
+        writer.writerow(df.columns)
+        writer.writerows(zip(*(df[column].tolist() for column in df.columns)))
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Analyze CODES experiment results")
+    parser.add_argument("path", nargs="?",
+                        default="/home/development/kronos/2024-feb-22/experiments/dfly-72/union/milc-jacobi/results/exp-358",
+                        help="Path to experiment results directory")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false",
+                        help=f"Parse every model-result.txt again instead of reusing {CACHE_DIR}")
+    args = parser.parse_args()
+
     # Path to experiment results
-    base_path = "/home/development/kronos/2024-feb-22/experiments/dfly-72/union/milc-jacobi/results/exp-358"
+    base_path = args.path
     
     print("Analyzing CODES experiment results...")
     print("=" * 50)
     
     # Extract all data
-    results = analyze_all_experiments(base_path)
+    results = analyze_all_experiments(base_path, args.use_cache)
     
     # Calculate speedups and errors
-    speedup_data, error_data = calculate_speedups_and_errors(results)
-    
-    # Create DataFrames
-    speedup_df = pd.DataFrame(speedup_data)
-    error_df = pd.DataFrame(error_data)
+    speedup_df, error_df = calculate_speedups_and_errors(results)
     
     # Display results
     print("\n📊 SIMULATION RUNTIME SPEEDUPS")
     print("=" * 50)
     if not speedup_df.empty:
         # Pivot table for better readability
-        speedup_pivot = speedup_df.pivot(index='Experiment', columns='Mode', values='Speedup')
-        print(speedup_pivot.round(2))
+        speedup_pivot = speedup_df[['Experiment', 'Mode', 'Speedup']].pivot_table(
+            index='Experiment',
+            columns='Mode',
+            values='Speedup',
+            aggfunc='first',
+            observed=True
+        )
+        print(speedup_pivot.to_string(float_format='{:.2f}'.format))
         
         print(f"\nAverage speedups across all experiments:")
-        for mode in ['app-surrogate', 'app-net-not-freeze', 'app-net-freeze']:
-            if mode in speedup_pivot.columns:
-                avg_speedup = speedup_pivot[mode].mean()
-                print(f"  {mode}: {avg_speedup:.2f}×")
+        avg_speedups = speedup_df.groupby('Mode', observed=True)['Speedup'].mean()
+        for mode, avg_speedup in avg_speedups.reindex(SURROGATE_MODES).dropna().items():
+            print(f"  {mode}: {avg_speedup:.2f}×")
     else:
         print("No speedup data available")
     
@@ -193,18 +384,18 @@ def main():
     print("=" * 50)
     if not error_df.empty:
         # Pivot table for better readability
-        error_pivot = error_df.pivot_table(
+        error_pivot = error_df[['Experiment', 'Application', 'Mode', 'Error_Percent']].pivot_table(
             index=['Experiment', 'Application'], 
             columns='Mode', 
-            values='Error_Percent'
+            values='Error_Percent',
+            observed=True
         )
-        print(error_pivot.round(2))
+        print(error_pivot.to_string(float_format='{:.2f}'.format))
         
         print(f"\nAverage absolute errors across all experiments:")
-        for mode in ['app-surrogate', 'app-net-not-freeze', 'app-net-freeze']:
-            if mode in error_pivot.columns:
-                avg_abs_error = error_pivot[mode].abs().mean()
-                print(f"  {mode}: {avg_abs_error:.2f}%")
+        avg_abs_errors = error_df.assign(Abs_Error=error_df['Error_Percent'].abs()).groupby('Mode', observed=True)['Abs_Error'].mean()
+        for mode, avg_abs_error in avg_abs_errors.reindex(SURROGATE_MODES).dropna().items():
+            print(f"  {mode}: {avg_abs_error:.2f}%")
     else:
         print("No error data available")
     
@@ -212,8 +403,8 @@ def main():
     print(f"\n💾 SAVING DETAILED RESULTS")
     print("=" * 50)
     
-    speedup_df.to_csv('speedup_results.csv', index=False)
-    error_df.to_csv('error_results.csv', index=False)
+    write_csv(speedup_df, 'speedup_results.csv')
+    write_csv(error_df, 'error_results.csv')
     
     print("Saved detailed results to:")
     print("  - speedup_results.csv")
@@ -224,16 +415,19 @@ def main():
     print("=" * 50)
     
     if not speedup_df.empty:
+        best = speedup_df['Speedup'].idxmax()
+        worst = speedup_df['Speedup'].idxmin()
         print(f"Total simulations analyzed: {len(speedup_df)}")
-        print(f"Best speedup: {speedup_df['Speedup'].max():.2f}× ({speedup_df.loc[speedup_df['Speedup'].idxmax(), 'Experiment']} - {speedup_df.loc[speedup_df['Speedup'].idxmax(), 'Mode']})")
-        print(f"Worst speedup: {speedup_df['Speedup'].min():.2f}× ({speedup_df.loc[speedup_df['Speedup'].idxmin(), 'Experiment']} - {speedup_df.loc[speedup_df['Speedup'].idxmin(), 'Mode']})")
+        print(f"Best speedup: {speedup_df.at[best, 'Speedup']:.2f}× ({speedup_df.at[best, 'Experiment']} - {speedup_df.at[best, 'Mode']})")
+        print(f"Worst speedup: {speedup_df.at[worst, 'Speedup']:.2f}× ({speedup_df.at[worst, 'Experiment']} - {speedup_df.at[worst, 'Mode']})")
     
     if not error_df.empty:
-        print(f"Best accuracy: {error_df['Error_Percent'].abs().min():.2f}% error")
-        print(f"Worst accuracy: {error_df['Error_Percent'].abs().max():.2f}% error")
+        abs_errors = error_df['Error_Percent'].abs()
+        print(f"Best accuracy: {abs_errors.min():.2f}% error")
+        print(f"Worst accuracy: {abs_errors.max():.2f}% error")
         
         # Check how many results have < 5% error
-        low_error_count = (error_df['Error_Percent'].abs() < 5.0).sum()
+        low_error_count = (abs_errors < 5.0).sum()
         total_error_count = len(error_df)
         print(f"Results with <5% error: {low_error_count}/{total_error_count} ({low_error_count/total_error_count*100:.1f}%)")
 
@@ -6,7 +6,9 @@ synch=3
 expfolder="$PWD"
 export CONFIGS_PATH="$PATH_TO_SCRIPT_DIR/conf"
 
-# Function to backup and restore original config files
+# Function to backup and restore original config files.
+# restore_configs runs from an EXIT trap, so the originals come back even when
+# the script is interrupted or a run fails partway through.
 backup_configs() {
     tmpdir="$(TMPDIR="$PWD" mktemp -d)"
     mv "$PATH_TO_SWM_INSTALL/share/milc_skeleton.json" "$tmpdir/milc_skeleton.json"
@@ -14,9 +16,20 @@ backup_configs() {
 }
 
 restore_configs() {
-    mv "$tmpdir/milc_skeleton.json" "$PATH_TO_SWM_INSTALL/share/milc_skeleton.json"
-    mv "$tmpdir/conceptual.json" "$PATH_TO_UNION_INSTALL/share/conceptual.json"
-    rmdir "$tmpdir"
+    # The backup is the only copy of the originals, keep it unless both are back in place
+    if mv "$tmpdir/milc_skeleton.json" "$PATH_TO_SWM_INSTALL/share/milc_skeleton.json" &&
+       mv "$tmpdir/conceptual.json" "$PATH_TO_UNION_INSTALL/share/conceptual.json"; then
+        rmdir "$tmpdir"
+    else
+        echo "Error: Could not restore the original config files, they were left in $tmpdir" >&2
+    fi
+}
+
+# Put a generated config in its install location. A hard link avoids copying the
+# data; `ln -f` swaps the directory entry, so the previous experiment's file is untouched.
+# Falls back to cp when the two paths are on different filesystems.
+install_config() {
+    ln -f "$1" "$2" 2>/dev/null || cp "$1" "$2"
 }
 
 # Common CODES config settings
@@ -68,21 +81,9 @@ generate_non_overlapping_allocations() {
     # Generate shuffled list of required nodes
     local all_nodes=($(shuf -i 0-71 -n $total_needed))
     
-    # Split into jacobi and milc allocations
-    local jacobi_alloc=""
-    local milc_alloc=""
-    
-    for i in $(seq 0 $((jacobi_nodes-1))); do
-        jacobi_alloc="$jacobi_alloc ${all_nodes[$i]}"
-    done
-    
-    for i in $(seq $jacobi_nodes $((total_needed-1))); do
-        milc_alloc="$milc_alloc ${all_nodes[$i]}"
-    done
-    
-    # Remove leading spaces and export
-    export JACOBI_ALLOCATION=$(echo $jacobi_alloc | sed 's/^ *//')
-    export MILC_ALLOCATION=$(echo $milc_alloc | sed 's/^ *//')
+    # Split into jacobi and milc allocations (array slices join with single spaces)
+    export JACOBI_ALLOCATION="${all_nodes[*]:0:jacobi_nodes}"
+    export MILC_ALLOCATION="${all_nodes[*]:jacobi_nodes}"
 }
 
 # Function to generate base configuration for an experiment
@@ -144,8 +145,8 @@ generate_base_config() {
     envsubst < "$CONFIGS_PATH/rand_node0-1d-72-jacobi_MILC.alloc.conf" > "$exp_config_dir/rand_node0-1d-72-jacobi_MILC.alloc.conf"
     
     # Copy configs to install locations
-    cp "$exp_config_dir/milc_skeleton.json" "$PATH_TO_SWM_INSTALL/share/milc_skeleton.json"
-    cp "$exp_config_dir/conceptual.json" "$PATH_TO_UNION_INSTALL/share/conceptual.json"
+    install_config "$exp_config_dir/milc_skeleton.json" "$PATH_TO_SWM_INSTALL/share/milc_skeleton.json"
+    install_config "$exp_config_dir/conceptual.json" "$PATH_TO_UNION_INSTALL/share/conceptual.json"
 }
 
 # Function to run a specific simulation mode
@@ -208,8 +209,9 @@ run_experiment_with_modes() {
     echo "----------------------------------------"
 }
 
-# Backup original config files
+# Backup original config files (restored on exit)
 backup_configs
+trap restore_configs EXIT
 setup_common_config
 
 # Run all experiments with all simulation modes
@@ -239,6 +241,3 @@ run_experiment_with_modes \
     exp_name="5-high-concurrency" \
     jacobi_iters=400 jacobi_msg=80000 jacobi_layout="6,6,1" jacobi_nodes=36 \
     milc_iters=80 milc_msg=250000 milc_nodes=36 milc_layout="6,6,1,1"
-
-# Restore original config files
-restore_configs
@@ -4,9 +4,15 @@ Analyze CODES experiment results to extract runtime performance and application
 Mostly written by Claude.
 """
 
+import os
 import re
+import csv
 import json
+import pickle
+import tempfile
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 import sys
 from typing import Any
@@ -21,6 +27,22 @@ SIMULATION_MODES = [
 
 SURROGATE_MODES = ['app-surrogate', 'app-and-network', 'app-and-network-freezing']
 
+# Patterns used to parse model-result.txt files (read as bytes, never decoded) and experiment names
+RUNTIME_PATTERN = re.compile(rb'Running Time = ([\d.]+) seconds')
+APP_TIME_PATTERN = re.compile(rb'App (\d+): ([\d.]+)')
+NET_EVENTS_PATTERN = re.compile(rb'Net Events Processed\s+(\d+)')
+ITERATION_EXPERIMENT_PATTERN = re.compile(r'(.+)_iter=(\d+)$')
+# How much of the end of a model-result.txt is searched before falling back to the whole file
+MODEL_RESULT_TAIL_BYTES = 64 * 1024
+
+# Parsed model-result.txt files, kept next to the results:
+# (experiment, mode) -> ((mtime, size, expected app count), parsed)
+ANALYSIS_CACHE_FILE = '.analysis_cache.pkl'
+# Bump when the parsed format changes so stale caches are ignored
+ANALYSIS_CACHE_VERSION = 3
+
+ModelResultCache = dict[tuple[str, str], tuple[tuple[int, int, int | None], dict[str, Any]]]
+
 def load_experiment_metadata(base_path: Path) -> dict[str, list[str]]:
     """Load experiment metadata from JSON file"""
     metadata_file = base_path / "experiment_metadata.json"
@@ -34,20 +56,18 @@ def load_experiment_metadata(base_path: Path) -> dict[str, list[str]]:
         print(f"Error parsing metadata file: {e}")
         return {}
 
-def extract_simulation_runtime(content: str, model_result_path: Path) -> float | None:
+def extract_simulation_runtime(content: bytes) -> float | None:
     """Extract the simulation runtime from model-result.txt content"""
     # Look for "Running Time = X.XXXX seconds"
-    match = re.search(r'Running Time = ([\d.]+) seconds', content)
+    match = RUNTIME_PATTERN.search(content)
     if match:
         return float(match.group(1))
-    else:
-        print(f"Warning: Could not find running time in {model_result_path}")
-        return None
+    return None
 
-def extract_app_completion_times(content: str) -> dict[int, float]:
+def extract_app_completion_times(content: bytes) -> dict[int, float]:
     """Extract application completion times from model-result.txt content"""
     # Look for all "App X: XXXXX.XXXX" patterns
-    app_matches = re.findall(r'App (\d+): ([\d.]+)', content)
+    app_matches = APP_TIME_PATTERN.findall(content)
 
     app_times: dict[int, float] = {}
     for app_id, time_str in app_matches:  # type: ignore[misc]
@@ -55,64 +75,145 @@ def extract_app_completion_times(content: str) -> dict[int, float]:
 
     return app_times
 
-def extract_net_events_processed(content: str, model_result_path: Path) -> int | None:
+def extract_net_events_processed(content: bytes) -> int | None:
     """Extract the net events processed from model-result.txt content"""
     # Look for "Net Events Processed                                XXXXXXXX"
-    match = re.search(r'Net Events Processed\s+(\d+)', content)
+    match = NET_EVENTS_PATTERN.search(content)
     if match:
         return int(match.group(1))
-    else:
+    return None
+
+def parse_model_result_content(content: bytes) -> dict[str, float | dict[int, float] | None]:
+    """Extract runtime, app completion times and net events from model-result.txt content"""
+    return {
+        'runtime': extract_simulation_runtime(content),
+        'app_times': extract_app_completion_times(content),
+        'net_events': extract_net_events_processed(content)
+    }
+
+def _app_times_complete(app_times: dict[int, float], expected_apps: int | None) -> bool:
+    """Whether app_times holds every app: ids 0 to max without gaps, as many as expected if known"""
+    if not app_times or max(app_times) != len(app_times) - 1:
+        return False
+    return expected_apps is None or len(app_times) == expected_apps
+
+def parse_model_result(model_result_path: Path, expected_apps: int | None = None) -> dict[str, float | dict[int, float] | None]:
+    """Read model-result.txt as raw bytes and extract runtime, app completion times and net events
+
+    Everything we look for is printed with the end-of-run statistics, so large files are
+    parsed from their last MODEL_RESULT_TAIL_BYTES only. If the runtime or net events are
+    missing from that window the whole file is parsed instead. App times found in the window
+    are only kept when they form a complete set (see _app_times_complete, expected_apps is
+    the number of jobs when known), otherwise the whole file is searched for them.
+    """
+    with open(model_result_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > MODEL_RESULT_TAIL_BYTES:
+            _ = f.seek(size - MODEL_RESULT_TAIL_BYTES)
+            parsed = parse_model_result_content(f.read())
+            if parsed['runtime'] is not None and parsed['net_events'] is not None:
+                if not _app_times_complete(parsed['app_times'], expected_apps):
+                    # Some App lines may have been printed before the window
+                    _ = f.seek(0)
+                    parsed['app_times'] = extract_app_completion_times(f.read())
+                return parsed
+            _ = f.seek(0)
+        return parse_model_result_content(f.read())
+
+def load_analysis_cache(base_path: Path) -> ModelResultCache:
+    """Load previously parsed model-result.txt files for this results directory"""
+    cache_file = base_path / ANALYSIS_CACHE_FILE
+    try:
+        with open(cache_file, 'rb') as f:
+            version, cache = pickle.load(f)
+    except FileNotFoundError:
+        return {}
+    except (pickle.UnpicklingError, EOFError, ValueError, TypeError) as e:
+        print(f"Warning: Ignoring corrupted analysis cache {cache_file}: {e}")
+        return {}
+    return cache if version == ANALYSIS_CACHE_VERSION else {}
+
+def save_analysis_cache(base_path: Path, cache: ModelResultCache) -> None:
+    """Store parsed results, written to a temporary file first so the cache is never half-written"""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=base_path, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((ANALYSIS_CACHE_VERSION, cache), f)
+        os.replace(tmp_path, base_path / ANALYSIS_CACHE_FILE)
+    except OSError as e:
+        print(f"Warning: Could not save analysis cache in {base_path}: {e}")
+
+def load_model_result(model_result_path: Path, exp: str, mode: str, cache: ModelResultCache,
+                      expected_apps: int | None = None) -> dict[str, Any]:
+    """Parse model-result.txt unless the cache already holds it at its current mtime and size
+
+    The expected app count is part of the stamp, since it decides whether a tail-only parse is kept.
+    """
+    stat = model_result_path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size, expected_apps)
+    cached = cache.get((exp, mode))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    parsed = parse_model_result(model_result_path, expected_apps)
+    cache[(exp, mode)] = (stamp, parsed)
+    return parsed
+
+def load_model_results(tasks: list[tuple[str, str, Path]], cache: ModelResultCache,
+                       job_info: dict[str, list[str]]) -> list[dict[str, Any] | Exception]:
+    """Load the (experiment, mode, path) model results concurrently, in task order
+
+    Files are independent and mostly I/O bound, so they are read on a thread pool. Failures
+    are returned rather than raised so callers can report them in order.
+    """
+    def load(task: tuple[str, str, Path]) -> dict[str, Any] | Exception:
+        exp, mode, model_result_path = task
+        expected_apps = len(job_info[exp]) if job_info.get(exp) else None
+        try:
+            return load_model_result(model_result_path, exp, mode, cache, expected_apps)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor() as pool:
+        return list(pool.map(load, tasks))
+
+def warn_incomplete_model_result(model_result_path: Path, parsed: dict[str, Any]) -> None:
+    if parsed['runtime'] is None:
+        print(f"Warning: Could not find running time in {model_result_path}")
+    if parsed['net_events'] is None:
         print(f"Warning: Could not find net events processed in {model_result_path}")
-        return None
 
-def analyze_all_experiments(base_path: Path, job_info: dict[str, list[str]]) -> list[dict[str, str | list[str] | dict[str, float | dict[int, float] | None]]]:
+def analyze_all_experiments(base_path: Path, job_info: dict[str, list[str]], cache: ModelResultCache) -> list[dict[str, str | list[str] | dict[str, float | dict[int, float] | None]]]:
     """Analyze all experiments and return structured data"""
 
     # Get experiment directories from the actual results folder
     base_path = Path(base_path)
-    experiments = [d.name for d in base_path.iterdir() if d.is_dir()]
-    experiments.sort()
+    with os.scandir(base_path) as it:
+        experiments = sorted(e.name for e in it if e.is_dir())
 
     # Analyze all simulation modes
     modes = SIMULATION_MODES
 
     results: list[dict[str, str | list[str] | dict[str, float | dict[int, float] | None]]] = []
 
-    for exp in experiments:
-        exp_path = base_path / exp
-        if not exp_path.exists():
-            print(f"Warning: Experiment {exp} not found at {exp_path}")
-            continue
+    tasks = [(exp, mode, base_path / exp / mode / "model-result.txt") for exp in experiments for mode in modes]
+    loaded = iter(zip(tasks, load_model_results(tasks, cache, job_info)))
 
+    for exp in experiments:
         exp_data = {}
 
-        for mode in modes:
-            mode_path = exp_path / mode / "model-result.txt"
-            if not mode_path.exists():
+        for (_, mode, mode_path), outcome in islice(loaded, len(modes)):
+            if isinstance(outcome, FileNotFoundError):
                 print(f"Warning: {mode} not found for {exp}")
-                continue
-
-            # Read file once and extract all data
-            try:
-                with open(mode_path, 'r') as f:
-                    content = f.read()
-
-                runtime = extract_simulation_runtime(content, mode_path)
-                app_times = extract_app_completion_times(content)
-                net_events = extract_net_events_processed(content, mode_path)
-
-                exp_data[mode] = {
-                    'runtime': runtime,
-                    'app_times': app_times,
-                    'net_events': net_events
-                }
-            except Exception as e:
-                print(f"Error reading {mode_path}: {e}")
+            elif isinstance(outcome, Exception):
+                print(f"Error reading {mode_path}: {outcome}")
                 exp_data[mode] = {
                     'runtime': None,
                     'app_times': {},
                     'net_events': None
                 }
+            else:
+                warn_incomplete_model_result(mode_path, outcome)
+                exp_data[mode] = outcome
 
         results.append({
             'experiment': exp,
@@ -122,14 +223,18 @@ def analyze_all_experiments(base_path: Path, job_info: dict[str, list[str]]) ->
 
     return results
 
-def calculate_speedups_and_errors(results: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
-    """Calculate speedups, application completion errors, and event metrics"""
+def _is_valid(values: pd.Series) -> pd.Series:
+    """Measurements that are present and non-zero, the condition every ratio below needs"""
+    return values.notna() & (values != 0)
 
-    speedup_data = []
-    error_data = []
-    dashboard_data = []
+def calculate_speedups_and_errors(results: list[dict[str, Any]]) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Calculate speedups, application completion errors, and event metrics"""
 
-    for result in results:
+    # Flatten everything into long tables, one row per (experiment, mode) and one per
+    # (experiment, mode, app); positions keep the original output order through the merges
+    run_rows = []
+    app_rows = []
+    for exp_pos, result in enumerate(results):
         exp_name = result['experiment']
         data = result['data']
         job_types = result['job_types']
@@ -138,87 +243,76 @@ def calculate_speedups_and_errors(results: list[dict[str, Any]]) -> tuple[list[d
             print(f"Warning: No high-fidelity data for {exp_name}")
             continue
 
-        hf_runtime = data['high-fidelity']['runtime']
-        hf_app_times = data['high-fidelity']['app_times']
-        hf_net_events = data['high-fidelity']['net_events']
-
-        for mode in SURROGATE_MODES:
+        for mode_pos, mode in enumerate(['high-fidelity'] + SURROGATE_MODES):
             if mode not in data:
                 continue
 
             mode_data = data[mode]
-
-            # Calculate speedup
-            speedup = None
-            if hf_runtime and mode_data['runtime']:
-                speedup = hf_runtime / mode_data['runtime']
-                speedup_data.append({
-                    'Experiment': exp_name,
-                    'Mode': mode,
-                    'HF_Runtime_s': hf_runtime,
-                    'Surrogate_Runtime_s': mode_data['runtime'],
-                    'Speedup': speedup
-                })
-
-            # Calculate event metrics
-            events_skipped_pct = None
-            theoretical_speedup = None
-            if hf_net_events and mode_data['net_events']:
-                event_ratio = mode_data['net_events'] / hf_net_events
-                events_skipped_pct = (1 - event_ratio) * 100
-                theoretical_speedup = 1 / event_ratio
-
-            # Calculate application completion errors and collect for dashboard
-            app_errors = []
-            for app_id in hf_app_times.keys():
-                if app_id in mode_data['app_times']:
-                    hf_time = hf_app_times[app_id]
-                    mode_time = mode_data['app_times'][app_id]
-
-                    if hf_time and mode_time:
-                        error = ((mode_time - hf_time) / hf_time) * 100
-                        app_errors.append(abs(error))
-
-                        # Get application name
-                        app_name = f"App {app_id}"
-                        if app_id < len(job_types):
-                            app_name = f"{job_types[app_id]} (App {app_id})"
-
-                        error_data.append({
-                            'Experiment': exp_name,
-                            'Mode': mode,
-                            'Application': app_name,
-                            'HF_Completion_ns': hf_time,
-                            'Surrogate_Completion_ns': mode_time,
-                            'Error_Percent': error
-                        })
-
-            # Calculate dashboard metrics
-            if app_errors:
-                min_error = min(app_errors)
-                max_error = max(app_errors)
-                apps_above_5pct = sum(1 for err in app_errors if err > 5.0)
-                total_apps = len(app_errors)
-
-                # Calculate efficiency
-                efficiency = None
-                if speedup and theoretical_speedup:
-                    efficiency = speedup / theoretical_speedup
-
-                dashboard_data.append({
-                    'Experiment': exp_name,
-                    'Mode': mode,
-                    'Speedup': speedup,
-                    'Events_Skipped_Pct': events_skipped_pct,
-                    'Theoretical_Speedup': theoretical_speedup,
-                    'Efficiency': efficiency,
-                    'Min_Error_Pct': min_error,
-                    'Max_Error_Pct': max_error,
-                    'Apps_Above_5pct': apps_above_5pct,
-                    'Total_Apps': total_apps
-                })
-
-    return speedup_data, error_data, dashboard_data
+            run_rows.append((exp_name, mode, exp_pos, mode_pos, mode_data['runtime'], mode_data['net_events']))
+            for app_pos, (app_id, app_time) in enumerate(mode_data['app_times'].items()):
+                # Get application name
+                app_name = f"App {app_id}"
+                if app_id < len(job_types):
+                    app_name = f"{job_types[app_id]} (App {app_id})"
+                app_rows.append((exp_name, mode, exp_pos, mode_pos, app_pos, app_id, app_name, app_time))
+
+    # Mode is categorical so comparisons, grouping and pivoting work on integer codes
+    mode_dtype = pd.CategoricalDtype(SIMULATION_MODES)
+    runs = pd.DataFrame.from_records(
+        run_rows, columns=['Experiment', 'Mode', 'Exp_Pos', 'Mode_Pos', 'Runtime', 'Net_Events']
+    ).astype({'Mode': mode_dtype, 'Runtime': float, 'Net_Events': float})
+    apps = pd.DataFrame.from_records(
+        app_rows, columns=['Experiment', 'Mode', 'Exp_Pos', 'Mode_Pos', 'App_Pos', 'App_Id', 'Application', 'Completion']
+    ).astype({'Mode': mode_dtype, 'Completion': float})
+
+    # Pair every surrogate run with its experiment's high-fidelity run (inner merge keeps left order)
+    is_hf_run = runs['Mode'] == 'high-fidelity'
+    runs = runs[~is_hf_run].merge(
+        runs.loc[is_hf_run, ['Experiment', 'Runtime', 'Net_Events']], on='Experiment', suffixes=('', '_HF')
+    )
+
+    # Calculate speedup
+    has_speedup = _is_valid(runs['Runtime_HF']) & _is_valid(runs['Runtime'])
+    runs['Speedup'] = (runs['Runtime_HF'] / runs['Runtime']).where(has_speedup)
+
+    # Calculate event metrics
+    event_ratio = (runs['Net_Events'] / runs['Net_Events_HF']).where(_is_valid(runs['Net_Events_HF']) & _is_valid(runs['Net_Events']))
+    runs['Events_Skipped_Pct'] = (1 - event_ratio) * 100
+    runs['Theoretical_Speedup'] = 1 / event_ratio
+    runs['Efficiency'] = runs['Speedup'] / runs['Theoretical_Speedup']
+
+    speedup_df = runs.loc[has_speedup, ['Experiment', 'Mode', 'Runtime_HF', 'Runtime', 'Speedup']].rename(
+        columns={'Runtime_HF': 'HF_Runtime_s', 'Runtime': 'Surrogate_Runtime_s'}
+    ).reset_index(drop=True)
+
+    # Calculate application completion errors against the same app in the high-fidelity run
+    is_hf_app = apps['Mode'] == 'high-fidelity'
+    errors = apps[~is_hf_app].merge(
+        apps.loc[is_hf_app, ['Experiment', 'App_Id', 'App_Pos', 'Completion']], on=['Experiment', 'App_Id'], suffixes=('', '_HF')
+    )
+    errors = errors[_is_valid(errors['Completion_HF']) & _is_valid(errors['Completion'])]
+    errors = errors.sort_values(['Exp_Pos', 'Mode_Pos', 'App_Pos_HF'], kind='stable')
+    errors['Error_Percent'] = ((errors['Completion'] - errors['Completion_HF']) / errors['Completion_HF']) * 100
+
+    error_df = errors[['Experiment', 'Mode', 'Application', 'Completion_HF', 'Completion', 'Error_Percent']].rename(
+        columns={'Completion_HF': 'HF_Completion_ns', 'Completion': 'Surrogate_Completion_ns'}
+    ).reset_index(drop=True)
+
+    # Calculate dashboard metrics, only for runs with at least one comparable app
+    abs_errors = errors.assign(Abs_Error=errors['Error_Percent'].abs(), Above_5pct=errors['Error_Percent'].abs() > 5.0)
+    error_stats = abs_errors.groupby(['Experiment', 'Mode'], sort=False, observed=True).agg(
+        Min_Error_Pct=('Abs_Error', 'min'),
+        Max_Error_Pct=('Abs_Error', 'max'),
+        Apps_Above_5pct=('Above_5pct', 'sum'),
+        Total_Apps=('Abs_Error', 'size'),
+    ).reset_index()
+
+    dashboard_df = runs.merge(error_stats, on=['Experiment', 'Mode'])[[
+        'Experiment', 'Mode', 'Speedup', 'Events_Skipped_Pct', 'Theoretical_Speedup', 'Efficiency',
+        'Min_Error_Pct', 'Max_Error_Pct', 'Apps_Above_5pct', 'Total_Apps'
+    ]]
+
+    return speedup_df, error_df, dashboard_df
 
 def parse_iteration_experiment_name(exp_name: str) -> tuple[str, int | None]:
     """Parse experiment name to extract base name and iteration number.
@@ -226,21 +320,18 @@ def parse_iteration_experiment_name(exp_name: str) -> tuple[str, int | None]:
     Returns:
         tuple: (base_name, iteration_number) or (exp_name, None) if no iteration found
     """
-    match = re.match(r'(.+)_iter=(\d+)$', exp_name)
+    match = ITERATION_EXPERIMENT_PATTERN.match(exp_name)
     if match:
         base_name = match.group(1)
         iteration = int(match.group(2))
         return base_name, iteration
     return exp_name, None
 
-def analyze_iteration_experiments(base_path: Path, job_info: dict[str, list[str]]) -> dict[str, list[dict[str, Any]]]:
+def analyze_iteration_experiments(base_path: Path, job_info: dict[str, list[str]], cache: ModelResultCache) -> dict[str, list[dict[str, Any]]]:
     """Analyze iteration experiments grouped by base experiment name"""
-    all_experiments = []
-
     # Get all experiments in the directory
-    for exp_dir in base_path.iterdir():
-        if exp_dir.is_dir() and not exp_dir.name.startswith('.'):
-            all_experiments.append(exp_dir.name)
+    with os.scandir(base_path) as it:
+        all_experiments = [e.name for e in it if e.is_dir() and not e.name.startswith('.')]
 
     # Group experiments by base name
     iteration_groups: dict[str, list[str]] = {}
@@ -257,39 +348,29 @@ def analyze_iteration_experiments(base_path: Path, job_info: dict[str, list[str]
         print(f"Analyzing iteration group: {base_name}")
 
         # Analyze each experiment in the group
-        group_results = []
-        for exp_name in sorted(exp_list):  # Sort to ensure consistent order
-            exp_path = base_path / exp_name
+        exp_list = sorted(exp_list)  # Sort to ensure consistent order
+        modes = ['high-fidelity'] + SURROGATE_MODES
+        tasks = [(exp_name, mode, base_path / exp_name / mode / 'model-result.txt') for exp_name in exp_list for mode in modes]
+        loaded = iter(zip(tasks, load_model_results(tasks, cache, job_info)))
 
+        group_results = []
+        for exp_name in exp_list:
             # Reuse existing analysis logic
             exp_data: dict[str, dict[str, Any]] = {}
 
-            for mode in ['high-fidelity'] + SURROGATE_MODES:
-                mode_path = exp_path / mode / 'model-result.txt'
-                if not mode_path.exists():
+            for (_, mode, mode_path), outcome in islice(loaded, len(modes)):
+                if isinstance(outcome, FileNotFoundError):
                     continue
-
-                # Read file once and extract all data
-                try:
-                    with open(mode_path, 'r') as f:
-                        content = f.read()
-
-                    runtime = extract_simulation_runtime(content, mode_path)
-                    app_times = extract_app_completion_times(content)
-                    net_events = extract_net_events_processed(content, mode_path)
-
-                    exp_data[mode] = {
-                        'runtime': runtime,
-                        'app_times': app_times,
-                        'net_events': net_events
-                    }
-                except Exception as e:
-                    print(f"Error reading {mode_path}: {e}")
+                elif isinstance(outcome, Exception):
+                    print(f"Error reading {mode_path}: {outcome}")
                     exp_data[mode] = {
                         'runtime': None,
                         'app_times': {},
                         'net_events': None
                     }
+                else:
+                    warn_incomplete_model_result(mode_path, outcome)
+                    exp_data[mode] = outcome
 
             # Parse iteration number
             _, iteration = parse_iteration_experiment_name(exp_name)
@@ -371,16 +452,13 @@ def calculate_iteration_metrics(iteration_results: list[dict[str, Any]]) -> list
             if speedup and theoretical_speedup:
                 efficiency = speedup / theoretical_speedup
 
-            # Calculate application errors
-            app_errors = []
-            for app_id in hf_app_times.keys():
-                if app_id in mode_data['app_times']:
-                    hf_time = hf_app_times[app_id]
-                    mode_time = mode_data['app_times'][app_id]
-
-                    if hf_time and mode_time:
-                        error = ((mode_time - hf_time) / hf_time) * 100
-                        app_errors.append(abs(error))
+            # Calculate absolute application errors, for apps measured in both runs
+            mode_app_times = mode_data['app_times']
+            app_errors = [
+                abs((mode_app_times[app_id] - hf_time) / hf_time) * 100
+                for app_id, hf_time in hf_app_times.items()
+                if hf_time and mode_app_times.get(app_id)
+            ]
 
             # Calculate error metrics
             min_error = min(app_errors) if app_errors else None
@@ -452,6 +530,13 @@ def generate_raw_data_csv(iteration_results: list[dict[str, Any]]) -> list[dict[
 
     return raw_data
 
+def write_records_csv(records: list[dict[str, Any]], path: str) -> None:
+    """Write a list of same-keyed row dicts to CSV, None values as empty cells"""
+    with open(path, 'w', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=list(records[0]), lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(records)
+
 def display_iteration_analysis(iteration_data: list[dict[str, Any]]) -> None:
     """Display iteration analysis results"""
     if not iteration_data:
@@ -516,16 +601,15 @@ def main_experiments_results(base_path: Path, saveas: Path | None = None) -> Non
     # Load job info from metadata file
     job_info = load_experiment_metadata(base_path)
 
-    # Extract all data
-    results = analyze_all_experiments(base_path, job_info)
+    # Extract all data, reusing the parse of any model-result.txt that has not changed
+    cache = load_analysis_cache(base_path)
+    cached_before = dict(cache)
+    results = analyze_all_experiments(base_path, job_info, cache)
+    if cache != cached_before:
+        save_analysis_cache(base_path, cache)
 
     # Calculate speedups and errors
-    speedup_data, error_data, dashboard_data = calculate_speedups_and_errors(results)
-
-    # Create DataFrames
-    speedup_df = pd.DataFrame(speedup_data)
-    error_df = pd.DataFrame(error_data)
-    dashboard_df = pd.DataFrame(dashboard_data)
+    speedup_df, error_df, dashboard_df = calculate_speedups_and_errors(results)
 
     # Display comprehensive dashboard first
     print("\nSIMULATION PERFORMANCE SUMMARY")
@@ -542,12 +626,13 @@ def main_experiments_results(base_path: Path, saveas: Path | None = None) -> Non
                 current_exp = row['Experiment']
                 print(f"\n{current_exp}")
 
-            speedup_str = f"{row['Speedup']:.2f}x" if row['Speedup'] else "N/A"
-            skipped_str = f"{row['Events_Skipped_Pct']:.1f}%" if row['Events_Skipped_Pct'] is not None else "N/A"
-            theoretical_str = f"{row['Theoretical_Speedup']:.2f}x" if row['Theoretical_Speedup'] else "N/A"
-            efficiency_str = f"{row['Efficiency']:.3f}" if row['Efficiency'] is not None else "N/A"
-            error_range_str = f"{row['Min_Error_Pct']:.1f}% - {row['Max_Error_Pct']:.1f}%" if row['Min_Error_Pct'] is not None else "N/A"
-            apps_str = f"{row['Apps_Above_5pct']}/{row['Total_Apps']}" if row['Apps_Above_5pct'] is not None else "N/A"
+            # Metrics that could not be computed are NaN
+            speedup_str = f"{row['Speedup']:.2f}x" if pd.notna(row['Speedup']) else "N/A"
+            skipped_str = f"{row['Events_Skipped_Pct']:.1f}%" if pd.notna(row['Events_Skipped_Pct']) else "N/A"
+            theoretical_str = f"{row['Theoretical_Speedup']:.2f}x" if pd.notna(row['Theoretical_Speedup']) else "N/A"
+            efficiency_str = f"{row['Efficiency']:.3f}" if pd.notna(row['Efficiency']) else "N/A"
+            error_range_str = f"{row['Min_Error_Pct']:.1f}% - {row['Max_Error_Pct']:.1f}%"
+            apps_str = f"{row['Apps_Above_5pct']}/{row['Total_Apps']}"
 
             print(f"  {row['Mode']:<23} {speedup_str:<8} {skipped_str:<9} {theoretical_str:<11} {efficiency_str:<10} {error_range_str:<15} {apps_str:<8}")
 
@@ -567,15 +652,15 @@ def main_experiments_results(base_path: Path, saveas: Path | None = None) -> Non
         error_pivot = error_df.pivot_table(
             index=['Experiment', 'Application'],
             columns='Mode',
-            values='Error_Percent'
+            values='Error_Percent',
+            observed=True
         ).reindex(columns=SURROGATE_MODES)
         print(error_pivot.round(2))
 
         print(f"\nAverage absolute errors across all experiments:")
-        for mode in SURROGATE_MODES:
-            if mode in error_pivot.columns:
-                avg_abs_error = error_pivot[mode].abs().mean()
-                print(f"  {mode}: {avg_abs_error:.2f}%")
+        # Every surrogate mode is a pivot column after the reindex, so all means come from one pass
+        for mode, avg_abs_error in error_pivot.abs().mean().items():
+            print(f"  {mode}: {avg_abs_error:.2f}%")
     else:
         print("No error data available")
 
@@ -598,16 +683,19 @@ def main_experiments_results(base_path: Path, saveas: Path | None = None) -> Non
     print("=" * 50)
 
     if not speedup_df.empty:
+        best = speedup_df['Speedup'].idxmax()
+        worst = speedup_df['Speedup'].idxmin()
         print(f"Total simulations analyzed: {len(speedup_df)}")
-        print(f"Best speedup: {speedup_df['Speedup'].max():.2f}× ({speedup_df.loc[speedup_df['Speedup'].idxmax(), 'Experiment']} - {speedup_df.loc[speedup_df['Speedup'].idxmax(), 'Mode']})")
-        print(f"Worst speedup: {speedup_df['Speedup'].min():.2f}× ({speedup_df.loc[speedup_df['Speedup'].idxmin(), 'Experiment']} - {speedup_df.loc[speedup_df['Speedup'].idxmin(), 'Mode']})")
+        print(f"Best speedup: {speedup_df.at[best, 'Speedup']:.2f}× ({speedup_df.at[best, 'Experiment']} - {speedup_df.at[best, 'Mode']})")
+        print(f"Worst speedup: {speedup_df.at[worst, 'Speedup']:.2f}× ({speedup_df.at[worst, 'Experiment']} - {speedup_df.at[worst, 'Mode']})")
 
     if not error_df.empty:
-        print(f"Best accuracy: {error_df['Error_Percent'].abs().min():.2f}% error")
-        print(f"Worst accuracy: {error_df['Error_Percent'].abs().max():.2f}% error")
+        abs_errors = error_df['Error_Percent'].abs()
+        print(f"Best accuracy: {abs_errors.min():.2f}% error")
+        print(f"Worst accuracy: {abs_errors.max():.2f}% error")
 
         # Check how many results have < 5% error
-        low_error_count = (error_df['Error_Percent'].abs() < 5.0).sum()
+        low_error_count = (abs_errors < 5.0).sum()
         total_error_count = len(error_df)
         print(f"Results with <5% error: {low_error_count}/{total_error_count} ({low_error_count/total_error_count*100:.1f}%)")
 
@@ -619,8 +707,12 @@ def main_iteration_analysis(base_path: Path, saveas: Path | None = None) -> None
     # Load job information
     job_info = load_experiment_metadata(base_path)
 
-    # Analyze iteration experiments
-    results_by_base = analyze_iteration_experiments(base_path, job_info)
+    # Analyze iteration experiments, reusing the parse of any model-result.txt that has not changed
+    cache = load_analysis_cache(base_path)
+    cached_before = dict(cache)
+    results_by_base = analyze_iteration_experiments(base_path, job_info, cache)
+    if cache != cached_before:
+        save_analysis_cache(base_path, cache)
 
     if not results_by_base:
         print("No iteration experiments found!")
@@ -639,20 +731,16 @@ def main_iteration_analysis(base_path: Path, saveas: Path | None = None) -> None
 
         # Save to CSV if requested
         if saveas and iteration_data:
-            import pandas as pd
-
             # Save iteration analysis
-            df = pd.DataFrame(iteration_data)
             analysis_filename = f"{saveas}_iteration_analysis_{base_name}.csv"
-            df.to_csv(analysis_filename, index=False)
+            write_records_csv(iteration_data, analysis_filename)
             print(f"\nIteration analysis saved to {analysis_filename}")
 
             # Generate and save raw data
             raw_data = generate_raw_data_csv(iteration_results)
             if raw_data:
-                raw_df = pd.DataFrame(raw_data)
                 raw_filename = f"{saveas}_raw_data_{base_name}.csv"
-                raw_df.to_csv(raw_filename, index=False)
+                write_records_csv(raw_data, raw_filename)
                 print(f"Raw data saved to {raw_filename}")
 
     print(f"\nAnalyzed {len(results_by_base)} base experiment(s) with iteration variants")
@@ -672,6 +760,6 @@ if __name__ == "__main__":
     base_path = Path(args.path)
 
     if args.iteration_analysis:
-        main_iteration_analysis(base_path, args.saveas)
+        main_iteration_analysis(base_path, args.save_as)
     else:
-        main_experiments_results(base_path, args.saveas)
+        main_experiments_results(base_path, args.save_as)
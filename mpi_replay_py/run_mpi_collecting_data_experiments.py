@@ -15,7 +15,6 @@ from .utils.jobs import Experiment, JacobiJob, MilcJob, LammpsJob, UrJob
 from .utils.runner import TestRunner, Execute
 
 seed = 14829 # Same seed makes the simulation deterministic
-scripts_root_dir = os.environ['SCRIPTS_ROOT_DIR']
 this_script_dir: Path = Path(__file__).parent
 configs_path = os.environ.get('PATH_TO_SCRIPT_DIR', str(this_script_dir)) + '/conf'
 executable_path = os.environ['PATH_TO_CODES_BUILD'] + '/src/model-net-mpi-replay'
@@ -50,13 +49,24 @@ def export_experiment_metadata(experiments_list: list[Experiment], output_path:
         job_types: list[str] = [job.__class__.__name__.replace("Job", "") for job in exp.jobs]
         metadata[exp.name] = job_types
 
-    metadata_file = os.path.join(output_path, "experiment_metadata.json")
+    metadata_file = output_path / "experiment_metadata.json"
     with open(metadata_file, 'w') as f:
         json.dump(metadata, f, indent=2)
 
     return metadata_file
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run CODES multi-application experiments")
+    parser.add_argument("--parallelism", type=int, default=1,
+                        help="Number of simulations to run at the same time (default: 1, keeps runtimes comparable)")
+    parser.add_argument("--force", action="store_true",
+                        help="Rerun simulations that already completed with the same configs")
+    args = parser.parse_args()
+    if args.parallelism < 1:
+        parser.error("--parallelism must be at least 1")
+
     # Define test experiments using new Experiment and Job classes
     experiments_72 = [
         Experiment(
@@ -129,26 +139,23 @@ if __name__ == "__main__":
         # normal execution mode
         execute = Execute(
             binary_path=['mpirun', '-np', str(np), executable_path],
-            scripts_dir=scripts_root_dir,
         )
         # debug using tmux-mpi (in parallel)
         #execute = Execute(
         #    binary_path=[os.environ['SCRIPTS_ROOT_DIR'] + '/tmux-mpi', str(np), 'gdb', '--args', executable_path],
-        #    scripts_dir=scripts_root_dir,
         #    env_vars={'TMUX_MPI_MODE': 'pane', 'TMUX_MPI_SYNC_PANES': '1', 'TMUX_MPI_MPIRUN': 'mpirun --map-by hwthread:oversubscribe'},
         #    redirect_output=False,
         #)
         # debug in sequential
         #execute = Execute(
         #    ['gdb', '--args', executable_path],
-        #    scripts_dir=scripts_root_dir,
         #    redirect_output=False,
         #)
 
         # Run 72-node experiments
         print("Running Network Experiments")
         config_generator_72 = ConfigGenerator(configs_path, exp_folder, random_seed=seed, random_allocation=True, network_config=DFLY_72)
-        runner_72 = TestRunner(template_vars, config_generator_72, execute_with=execute)
+        runner_72 = TestRunner(template_vars, config_generator_72, execute_with=execute, max_parallel=args.parallelism, force=args.force)
         runner_72.run_tests(experiments_72)
     except KeyboardInterrupt:
         # This should be handled by the signal handler, but just in case
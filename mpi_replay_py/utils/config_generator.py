@@ -4,6 +4,8 @@ Handles template processing.
 """
 
 import random
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from string import Template
 from .jobs import Experiment, Job
@@ -46,18 +48,53 @@ DFLY_8448 = NetworkConfig(
 )
 
 
+@lru_cache(maxsize=None)
+def _load_template(src_path: Path) -> tuple[Template, tuple[str, ...]] | None:
+    """Read and compile a template file once, along with the placeholders it uses.
+
+    Templates are reused across experiments, so neither the file nor its identifiers
+    need to be scanned again. A missing template is cached as None.
+    """
+    try:
+        with open(src_path, 'r') as f:
+            template = Template(f.read())
+    except FileNotFoundError:
+        return None
+    return template, tuple(template.get_identifiers())
+
+
+@lru_cache(maxsize=None)
+def _node_ids(max_nodes: int) -> tuple[str, ...]:
+    """Node ids 0..max_nodes-1 already formatted for allocation lines."""
+    return tuple(str(n) for n in range(max_nodes))
+
+
+def _write_if_changed(dst_path: Path, data: bytes) -> None:
+    """Write data to dst_path unless the file already holds exactly that content.
+
+    Re-running into an existing experiment folder regenerates the same configs, so
+    leaving them untouched avoids the write and keeps their mtimes stable.
+    """
+    try:
+        if dst_path.stat().st_size == len(data) and dst_path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    _ = dst_path.write_bytes(data)
+
+
 class ConfigGenerator:
     """Handles generation of configuration files for experiments."""
 
     def __init__(
         self,
-        configs_path: str,
+        configs_path: str | Path,
         exp_folder: Path,
         random_seed: int | None = None,
         random_allocation: bool = True,
         network_config: NetworkConfig = DFLY_72,
     ):
-        self.configs_path: str = configs_path
+        self.configs_path: Path = Path(configs_path)
         self.exp_folder: Path = exp_folder
         self.random_seed: int | None = random_seed
         self.random_allocation: bool = random_allocation
@@ -94,81 +131,82 @@ class ConfigGenerator:
         """Generate all configuration files for the experiment."""
 
         # Write direct config files (no templates needed)
-        self._write_workloads_settings(exp_config_dir, jobs)
-        self._write_workloads_json(exp_config_dir, jobs)
+        self._write_workloads_files(exp_config_dir, jobs)
         self._write_workloads_allocation(exp_config_dir, jobs)
 
         # Process job-specific templates
         self._process_job_templates(exp_config_dir, jobs, template_vars)
 
         # Process args-file template
-        src_path = Path(self.configs_path) / 'args-file.conf'
+        src_path = self.configs_path / 'args-file.conf'
         dst_path = exp_config_dir / 'args-file.conf'
         self.process_template(src_path, dst_path, template_vars)
 
-    def _write_workloads_settings(self, exp_config_dir: Path, jobs: list[Job]) -> None:
-        """Write workloads-settings.conf file directly."""
-        lines = [job.format_workloads_settings(job.job_id) for job in jobs]
-        content = '\n'.join(lines) + '\n'
-        with open(exp_config_dir / 'workloads-settings.conf', 'w') as f:
-            _ = f.write(content)
-
-    def _write_workloads_json(self, exp_config_dir: Path, jobs: list[Job]) -> None:
-        """Write workloads-json.conf file directly."""
-        lines: list[str] = [f'{job.job_id} {exp_config_dir}/{job.config_filename}' for job in jobs if job.config_filename]
-        content = '\n'.join(lines) + '\n'
-        with open(exp_config_dir / 'workloads-json.conf', 'w') as f:
-            _ = f.write(content)
+    def base_config_files(self, exp_config_dir: Path, jobs: list[Job]) -> list[Path]:
+        """Files written by generate_base_config that every simulation of the experiment reads."""
+        return [
+            exp_config_dir / 'workloads-settings.conf',
+            exp_config_dir / 'workloads-json.conf',
+            exp_config_dir / 'workloads-allocation.conf',
+            exp_config_dir / 'args-file.conf',
+        ] + [exp_config_dir / job.config_filename for job in jobs if job.config_filename]
+
+    def _write_workloads_files(self, exp_config_dir: Path, jobs: list[Job]) -> None:
+        """Write workloads-settings.conf and workloads-json.conf in one pass over the jobs."""
+        with open(exp_config_dir / 'workloads-settings.conf', 'w') as settings_file, \
+             open(exp_config_dir / 'workloads-json.conf', 'w') as json_file:
+            for job in jobs:
+                _ = settings_file.write(f'{job.format_workloads_settings(job.job_id)}\n')
+                if job.config_filename:
+                    _ = json_file.write(f'{job.job_id} {exp_config_dir}/{job.config_filename}\n')
 
     def _write_workloads_allocation(self, exp_config_dir: Path, jobs: list[Job]) -> None:
         """Write workloads-allocation.conf file directly."""
-        lines: list[str] = []
-
         total_needed = sum(job.nodes for job in jobs)
         if total_needed > self.network_config.max_nodes:
             raise ValueError(f"Total nodes required ({total_needed}) exceeds network capacity ({self.network_config.max_nodes})")
 
-        all_nodes = list(range(self.network_config.max_nodes))
+        # Shuffling the pre-formatted ids yields the same permutation as shuffling the
+        # integers, without converting every node back to a string for each experiment
+        all_nodes = list(_node_ids(self.network_config.max_nodes))
         if self.random_allocation:
-            if self.random_seed is not None:
-                prev_state = random.getstate()
-                random.seed(self.random_seed)
-                random.shuffle(all_nodes)
-                random.setstate(prev_state)
-            else:
-                random.shuffle(all_nodes)
-
-        # Generate allocation lines in the same order as workloads-settings.conf
-        idx = 0
-        for job in jobs:
-            job_nodes = all_nodes[idx:idx + job.nodes]
-            idx += job.nodes
-            lines.append(' '.join(map(str, job_nodes)))
-
-        content = '\n'.join(lines) + '\n'
+            # A private generator leaves the global random state alone; with a seed every
+            # experiment gets the same permutation, without one it is seeded from the OS
+            random.Random(self.random_seed).shuffle(all_nodes)
 
+        # Write allocation lines in the same order as workloads-settings.conf
+        # Each job takes the next job.nodes ids straight off the shuffled list
+        remaining_nodes = iter(all_nodes)
         with open(exp_config_dir / 'workloads-allocation.conf', 'w') as f:
-            _ = f.write(content)
+            for job in jobs:
+                _ = f.write(' '.join(islice(remaining_nodes, job.nodes)) + '\n')
 
     def _process_job_templates(self, exp_config_dir: Path, jobs: list[Job], template_vars: dict[str, str]) -> None:
         for job in jobs:
             if not (job.template_path and job.config_filename):
                 continue
-            src_path = Path(self.configs_path) / job.template_path
+            src_path = self.configs_path / job.template_path
             dst_path = exp_config_dir / job.config_filename
             self.process_template(src_path, dst_path, template_vars | job.template_vars)
 
     def process_template(self, src_path: Path, dst_path: Path, template_vars: dict[str, str]) -> None:
-        if not src_path.exists():
+        loaded = _load_template(src_path)
+        if loaded is None:
             return
 
-        with open(src_path, 'r') as f:
-            template_content = f.read()
+        template, needed = loaded
+        if '$' not in template.template:
+            # Nothing to substitute, the template is the config as is
+            _write_if_changed(dst_path, template.template.encode())
+            return
 
-        template = Template(template_content)
-        substituted_content = template.substitute(template_vars)
-        with open(dst_path, 'w') as f:
-            _ = f.write(substituted_content)
+        # Only look up the placeholders this template actually uses, and report
+        # every missing one at once instead of failing on the first
+        missing = [name for name in needed if name not in template_vars]
+        if missing:
+            raise KeyError(f"Template {src_path} is missing variables: {', '.join(missing)}")
+        substituted_content = template.substitute({name: template_vars[name] for name in needed})
+        _write_if_changed(dst_path, substituted_content.encode())
 
     def generate_network_config(self, exp_config_dir: Path, variation_name: str, template_vars: dict[str, str]) -> Path:
         dst_file = f'{self.network_config.output_prefix}-{variation_name}.conf'
@@ -179,7 +217,7 @@ class ConfigGenerator:
             'PATH_TO_CONNECTIONS': f'{self.configs_path}/{self.network_config.config_dir}',
         }
 
-        src_path = Path(self.configs_path) / self.network_config.config_dir / self.network_config.template_file
+        src_path = self.configs_path / self.network_config.config_dir / self.network_config.template_file
         dst_path = exp_config_dir / dst_file
         self.process_template(src_path, dst_path, template_vars)
         return dst_path
@@ -7,23 +7,29 @@ from __future__ import annotations
 import math
 import warnings
 from collections import defaultdict
+from collections.abc import Sequence
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import override, ClassVar
+from functools import cached_property
+from typing import override
+
+
+# Per job type bookkeeping for auto-generated key names, cleared for every new Experiment
+_instance_counters: defaultdict[type, int] = defaultdict(int)
+_used_key_names: defaultdict[type, set[str]] = defaultdict(set)
 
 
 def _initialize_key_name(instance: Job, job_class: type, default_base_name: str) -> str:
     """Shared key_name initialization logic for all job types"""
+    used_key_names = _used_key_names[job_class]
     if instance.key_name is None:
         # Auto-generate key name
-        job_class._instance_counter += 1
-        if job_class._instance_counter == 1:
-            instance.key_name = default_base_name
-        else:
-            instance.key_name = f"{default_base_name}-{job_class._instance_counter}"
+        _instance_counters[job_class] += 1
+        count = _instance_counters[job_class]
+        instance.key_name = default_base_name if count == 1 else f"{default_base_name}-{count}"
 
     # Check for collisions and warn
-    if instance.key_name in job_class._used_key_names:
+    if instance.key_name in used_key_names:
         warnings.warn(
             f"{job_class.__name__} key_name '{instance.key_name}' already used. "
             + "This may cause configuration conflicts.",
@@ -31,7 +37,7 @@ def _initialize_key_name(instance: Job, job_class: type, default_base_name: str)
             stacklevel=3
         )
 
-    job_class._used_key_names.add(instance.key_name)
+    used_key_names.add(instance.key_name)
     return instance.key_name
 
 
@@ -48,6 +54,7 @@ class Job(ABC):
     @property
     @abstractmethod
     def template_vars(self) -> dict[str, str]:
+        """Template variables for this job; subclasses compute them once per job."""
         pass
 
     @abstractmethod
@@ -69,23 +76,15 @@ class JacobiJob(Job):
     compute_delay: float
     key_name: str | None = None  # Optional override
 
-    _instance_counter: ClassVar[int] = 0
-    _used_key_names: ClassVar[set[str]] = set()
-
     def __post_init__(self):
         key_name = _initialize_key_name(self, JacobiJob, "jacobi3d")
+        self._layout_prod: int = math.prod(self.layout)
         self.job_id: str = f'conceptual-{key_name}'
         self.template_path: str | None = 'conceptual.json'
         self.config_filename: str | None = f'conceptual-{key_name}.json'
         self.description: str = f"Jacobi: {self.iters} iters, {self.msg}B msgs, {self.nodes} nodes, {self.compute_delay}μs delay"
 
-    @classmethod
-    def reset_counters(cls):
-        """Reset counters for testing purposes"""
-        cls._instance_counter = 0
-        cls._used_key_names.clear()
-
-    @property
+    @cached_property
     @override
     def template_vars(self) -> dict[str, str]:
         proc_x, proc_y, proc_z = self.layout
@@ -106,10 +105,9 @@ class JacobiJob(Job):
 
     @override
     def validate_layout(self) -> None:
-        jacobi_prod = math.prod(self.layout)
         if self.nodes > 0:
-            assert self.nodes == jacobi_prod, \
-                f"jacobi nodes have to coincide with layout: nodes={self.nodes} != prod(layout)={jacobi_prod}"
+            assert self.nodes == self._layout_prod, \
+                f"jacobi nodes have to coincide with layout: nodes={self.nodes} != prod(layout)={self._layout_prod}"
 
 
 @dataclass
@@ -117,29 +115,22 @@ class MilcJob(Job):
     """MILC (MIMD Lattice Computation) quantum chromodynamics job."""
     nodes: int
     iters: int
-    layout: list[int]
+    layout: Sequence[int]
     msg: int
     compute_delay: float
     key_name: str | None = None  # Optional override
     _cpu_freq: float = 4e9
 
-    _instance_counter: ClassVar[int] = 0
-    _used_key_names: ClassVar[set[str]] = set()
-
     def __post_init__(self):
         key_name = _initialize_key_name(self, MilcJob, "milc")
+        self.layout = tuple(self.layout)
+        self._layout_prod: int = math.prod(self.layout)
         self.job_id: str = key_name
         self.template_path: str | None = 'milc_skeleton.json'
         self.config_filename: str | None = f'{key_name}_skeleton.json'
         self.description: str = f"MILC: {self.iters} iters, {self.msg}B msgs, {self.nodes} nodes, {self.compute_delay}μs delay"
 
-    @classmethod
-    def reset_counters(cls):
-        """Reset counters for testing purposes"""
-        cls._instance_counter = 0
-        cls._used_key_names.clear()
-
-    @property
+    @cached_property
     @override
     def template_vars(self) -> dict[str, str]:
         return {
@@ -158,10 +149,9 @@ class MilcJob(Job):
 
     @override
     def validate_layout(self) -> None:
-        milc_prod = math.prod(self.layout)
         if self.nodes > 0:
-            assert self.nodes == milc_prod, \
-                f"milc nodes have to coincide with layout: nodes={self.nodes} != prod(layout)={milc_prod}"
+            assert self.nodes == self._layout_prod, \
+                f"milc nodes have to coincide with layout: nodes={self.nodes} != prod(layout)={self._layout_prod}"
 
 
 @dataclass
@@ -172,23 +162,15 @@ class LammpsJob(Job):
     time_steps: int
     key_name: str | None = None  # Optional override
 
-    _instance_counter: ClassVar[int] = 0
-    _used_key_names: ClassVar[set[str]] = set()
-
     def __post_init__(self):
         key_name = _initialize_key_name(self, LammpsJob, "lammps")
+        self._layout_prod: int = math.prod(self.replicas)
         self.job_id: str = key_name
         self.template_path: str | None = 'lammps_workload.json'
         self.config_filename: str | None = f'{key_name}_workload.json'
         self.description: str = f"LAMMPS: {self.nodes} nodes, {self.time_steps} time steps"
 
-    @classmethod
-    def reset_counters(cls):
-        """Reset counters for testing purposes"""
-        cls._instance_counter = 0
-        cls._used_key_names.clear()
-
-    @property
+    @cached_property
     @override
     def template_vars(self) -> dict[str, str]:
         lammps_x_replicas, lammps_y_replicas, lammps_z_replicas = self.replicas
@@ -203,10 +185,9 @@ class LammpsJob(Job):
 
     @override
     def validate_layout(self) -> None:
-        lammps_prod = math.prod(self.replicas)
         if self.nodes > 0:
-            assert self.nodes == lammps_prod, \
-                f"lammps nodes have to coincide with replicas: nodes={self.nodes} != prod(layout)={lammps_prod}"
+            assert self.nodes == self._layout_prod, \
+                f"lammps nodes have to coincide with replicas: nodes={self.nodes} != prod(layout)={self._layout_prod}"
 
 
 @dataclass
@@ -223,7 +204,7 @@ class UrJob(Job):
         self.config_filename: str | None = None
         self.description: str = f"UR: {self.nodes} nodes, {self.period}ns period"
 
-    @property
+    @cached_property
     @override
     def template_vars(self) -> dict[str, str]:
         return {}
@@ -283,6 +264,5 @@ class Experiment:
 
 def reset_all_job_counters():
     """Reset all job type counters for testing purposes"""
-    JacobiJob.reset_counters()
-    MilcJob.reset_counters()
-    LammpsJob.reset_counters()
+    _instance_counters.clear()
+    _used_key_names.clear()
@@ -5,92 +5,202 @@ Handles execution of experiments for multiple experiments and their network conf
 
 import os
 import sys
+import hashlib
 import subprocess
 import signal
+import threading
+import time
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
 from .jobs import Experiment
 from .config_generator import ConfigGenerator
 
 
 class MemoryLogger:
-    def __init__(self, scripts_dir: str):
-        self.scripts_dir: str = scripts_dir
-        self.process: subprocess.Popen[bytes] | None = None
-
-    def start(self) -> bool:
+    """Samples system memory into memory-log.txt from a background thread.
+
+    Produces the same `free -m` style table as memory-log.sh without spawning
+    a shell (and `free`/`date` every interval) for each simulation.
+    """
+    COLUMNS: list[str] = ['total', 'used', 'free', 'shared', 'buff/cache', 'available']
+
+    def __init__(self, interval: float = 10.0):
+        self.interval: float = interval
+        self.thread: threading.Thread | None = None
+        self.stop_event: threading.Event = threading.Event()
+
+    @staticmethod
+    def _read_meminfo() -> list[int]:
+        """Read /proc/meminfo and return the `free -m` Mem: columns in MiB."""
+        meminfo: dict[str, int] = {}
+        with open('/proc/meminfo', 'r') as f:
+            for line in f:
+                key, value = line.split(':', 1)
+                meminfo[key] = int(value.split()[0])
+
+        total = meminfo['MemTotal']
+        available = meminfo.get('MemAvailable', meminfo['MemFree'])
+        buff_cache = meminfo['Buffers'] + meminfo['Cached'] + meminfo.get('SReclaimable', 0)
+        values = [total, total - available, meminfo['MemFree'], meminfo.get('Shmem', 0), buff_cache, available]
+        return [v // 1024 for v in values]
+
+    @staticmethod
+    def _format_row(values: list[str]) -> str:
+        return values[0].rjust(16) + ''.join(v.rjust(12) for v in values[1:])
+
+    def _run(self, log_path: Path) -> None:
+        with open(log_path, 'w') as log_file:
+            _ = log_file.write(f"      date     time {self._format_row(self.COLUMNS)}\n")
+            while True:
+                timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+                values = [str(v) for v in self._read_meminfo()]
+                _ = log_file.write(f"{timestamp} {self._format_row(values)}\n")
+                log_file.flush()
+                if self.stop_event.wait(self.interval):
+                    break
+
+    def start(self, output_dir: Path) -> bool:
         try:
-            with open('memory-log.txt', 'w') as log_file:
-                self.process = subprocess.Popen([
-                    'bash', f"{self.scripts_dir}/memory-log.sh"
-                ], stdout=log_file)
+            # Fail here rather than inside the thread if meminfo is unavailable
+            _ = self._read_meminfo()
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._run, args=(output_dir / 'memory-log.txt',), daemon=True)
+            self.thread.start()
             return True
         except Exception as e:
             print(f"    ERROR: Failed to start memory logging: {e}")
             return False
 
     def stop(self) -> None:
-        if self.process:
+        # interrupt() and the simulation's own cleanup may both stop the logger; take the
+        # thread first so the other caller never sees it cleared between check and join
+        thread, self.thread = self.thread, None
+        if thread is not None:
+            self.stop_event.set()
+            thread.join(timeout=2)
+
+
+def _signal_process_group(process: subprocess.Popen[bytes], sig: signal.Signals) -> None:
+    """Send sig to the process group of process, or to process alone if the group is gone"""
+    try:
+        os.killpg(os.getpgid(process.pid), sig)
+    except OSError:
+        try:
+            process.send_signal(sig)
+        except OSError:
+            pass
+
+
+def _kill_process_groups(processes: list[subprocess.Popen[bytes]], grace: float = 3.0) -> None:
+    """Terminate every process group at once, then SIGKILL whatever outlives the shared grace period"""
+    for process in processes:
+        _signal_process_group(process, signal.SIGTERM)
+
+    deadline = time.monotonic() + grace
+    for process in processes:
+        try:
+            _ = process.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            _signal_process_group(process, signal.SIGKILL)
             try:
-                self.process.terminate()
-                _ = self.process.wait(timeout=2)
+                _ = process.wait(timeout=2)
             except subprocess.TimeoutExpired:
-                try:
-                    self.process.kill()
-                    _ = self.process.wait(timeout=1)
-                except:
-                    pass
-            except:
                 pass
-            self.process = None
+
+
+# Left in a simulation's output directory once it finished successfully, suffixed with
+# the digest of the configs, command and environment it ran with
+COMPLETION_MARKER_PREFIX = '.done-'
+
+
+def _config_digest(config_files: list[Path], extraparams: list[str],
+                   binary_path: list[str], env_vars: dict[str, str]) -> str:
+    """Digest of the config files, command, extra arguments and environment a simulation runs with"""
+    digest = hashlib.blake2b(digest_size=16)
+    for config_file in config_files:
+        try:
+            digest.update(config_file.read_bytes())
+        except FileNotFoundError:
+            pass
+        digest.update(b'\0')
+    env_settings = [f'{name}={value}' for name, value in sorted(env_vars.items())]
+    for parts in (binary_path, extraparams, env_settings):
+        digest.update('\0'.join(parts).encode())
+        # Separates the lists, so moving an argument from one to the next changes the digest
+        digest.update(b'\1')
+    return digest.hexdigest()
 
 
 class Execute:
-    def __init__(self, binary_path: list[str], scripts_dir: str, env_vars: dict[str, str] | None = None, redirect_output: bool = True):
+    def __init__(self, binary_path: list[str], env_vars: dict[str, str] | None = None, redirect_output: bool = True):
         self.binary_path: list[str] = binary_path
         self.env_vars: dict[str, str] = env_vars or {}
-        self.memory_logger: MemoryLogger = MemoryLogger(scripts_dir)
-        self.process: subprocess.Popen[bytes] | None = None
+        # Environment for every simulation, built once instead of merging os.environ per launch
+        self.child_env: dict[str, str] = os.environ | self.env_vars
         self.interrupted: bool = False
         self.redirect_output: bool = redirect_output
+        # Simulations (and their memory loggers) currently running; several may run at once.
+        # Reentrant because interrupt() runs from the SIGINT handler on the main thread.
+        self.processes: set[subprocess.Popen[bytes]] = set()
+        self.memory_loggers: set[MemoryLogger] = set()
+        self.lock: threading.RLock = threading.RLock()
 
-    def __call__(self, output_dir: str, additional_args: list[str] | None = None) -> bool:
+    def __call__(self, output_dir: Path, additional_args: list[str] | None = None) -> bool:
         complete_command = self.binary_path + (additional_args or [])
-        output_path = Path(output_dir)
+        output_path = output_dir.absolute()
 
-        with self.execution_context(output_path, self.env_vars):
+        with self.execution_context(output_path):
             if self.interrupted:
                 return False
-            return self._execute_command(complete_command)
+            return self._execute_command(complete_command, output_path)
 
     @contextmanager
-    def execution_context(self, output_dir: Path, env_vars: dict[str, str]) -> Generator[None, None, None]:
-        original_cwd = Path.cwd()
-        original_env = os.environ.copy()
+    def execution_context(self, output_dir: Path) -> Generator[None, None, None]:
+        memory_logger = MemoryLogger()
 
         try:
             output_dir.mkdir(exist_ok=True)
-            os.chdir(output_dir)
-            os.environ.update(env_vars)
 
-            if not self.memory_logger.start():
+            with self.lock:
+                self.memory_loggers.add(memory_logger)
+            if not memory_logger.start(output_dir):
                 raise RuntimeError("Failed to start memory logging")
 
             yield
 
         finally:
-            self._cleanup_all()
-            os.environ.clear()
-            os.environ.update(original_env)
-            os.chdir(original_cwd)
+            memory_logger.stop()
+            with self.lock:
+                self.memory_loggers.discard(memory_logger)
 
-    def _execute_command(self, command: list[str]) -> bool:
+    def _spawn(self, command: list[str], **popen_kwargs: Any) -> subprocess.Popen[bytes] | None:
+        """Start command in child_env, tracked so interrupt() can kill it.
+
+        The environment is passed to the child instead of being written into os.environ,
+        which would leak between simulations running in parallel.
+        """
+        with self.lock:
+            if self.interrupted:
+                return None
+            process = subprocess.Popen(command, env=self.child_env, **popen_kwargs)
+            self.processes.add(process)
+            return process
+
+    def _release(self, process: subprocess.Popen[bytes]) -> None:
+        if process.returncode is None:
+            _kill_process_groups([process])
+        with self.lock:
+            self.processes.discard(process)
+
+    def _execute_command(self, command: list[str], output_dir: Path) -> bool:
         try:
             if self.redirect_output:
-                return self._execute_with_file_output(command)
+                return self._execute_with_file_output(command, output_dir)
             else:
-                return self._execute_with_interactive_output(command)
+                return self._execute_with_interactive_output(command, output_dir)
 
         except KeyboardInterrupt:
             print("    Interrupted during command execution")
@@ -99,26 +209,31 @@ class Execute:
             print(f"    ERROR: Exception during command execution: {e}")
             return False
 
-    def _execute_with_file_output(self, command: list[str]) -> bool:
-        with open('model-result.txt', 'w') as stdout_file, \
-             open('model-result.stderr.txt', 'w') as stderr_file:
+    def _execute_with_file_output(self, command: list[str], output_dir: Path) -> bool:
+        with open(output_dir / 'model-result.txt', 'w') as stdout_file, \
+             open(output_dir / 'model-result.stderr.txt', 'w') as stderr_file:
 
-            self.process = subprocess.Popen(
+            process = self._spawn(
                 command,
                 stdout=stdout_file,
                 stderr=stderr_file,
-                preexec_fn=os.setsid
+                cwd=output_dir,
+                start_new_session=True
             )
+            if process is None:
+                return False
 
-            returncode = self.process.wait()
-            self.process = None
+            try:
+                returncode = process.wait()
+            finally:
+                self._release(process)
 
             if returncode != 0:
                 print(f"    ERROR: Command failed with return code {returncode}")
                 return False
             return True
 
-    def _execute_with_interactive_output(self, command: list[str]) -> bool:
+    def _execute_with_interactive_output(self, command: list[str], output_dir: Path) -> bool:
         def setup_child_process():
             # Create new session and process group - isolates subprocess from parent's signal handling
             os.setsid()
@@ -131,21 +246,22 @@ class Execute:
                     pass
 
         # Connect subprocess directly to terminal for full interactivity
-        self.process = subprocess.Popen(
+        process = self._spawn(
             command,
             stdin=sys.stdin,
             stdout=sys.stdout,
             stderr=sys.stderr,
+            cwd=output_dir,
             preexec_fn=setup_child_process
         )
+        if process is None:
+            return False
 
         # Forward SIGINT (Ctrl+C) from parent to subprocess process group
         def forward_signal_to_subprocess(signum: int, _frame: object):
-            if self.process is None:
-                return
             try:
                 # Send signal to entire process group, not just main process
-                os.killpg(self.process.pid, signum)
+                os.killpg(process.pid, signum)
             except (ProcessLookupError, OSError):
                 # Process may have already terminated
                 pass
@@ -154,8 +270,7 @@ class Execute:
         original_handler = signal.signal(signal.SIGINT, forward_signal_to_subprocess)
 
         try:
-            returncode = self.process.wait()
-            self.process = None
+            returncode = process.wait()
 
             if returncode != 0:
                 print(f"    ERROR: Command failed with return code {returncode}")
@@ -166,6 +281,8 @@ class Execute:
             print(f"    ERROR: Exception during interactive execution: {e}")
             return False
         finally:
+            self._release(process)
+
             # Restore original signal handler
             _ = signal.signal(signal.SIGINT, original_handler)
 
@@ -176,36 +293,15 @@ class Execute:
                 except OSError:
                     pass
 
-    def _kill_process(self) -> None:
-        if self.process:
-            try:
-                pgid = os.getpgid(self.process.pid)
-                os.killpg(pgid, signal.SIGTERM)
-                _ = self.process.wait(timeout=3)
-            except (subprocess.TimeoutExpired, ProcessLookupError, OSError):
-                try:
-                    pgid = os.getpgid(self.process.pid)
-                    os.killpg(pgid, signal.SIGKILL)
-                    _ = self.process.wait(timeout=2)
-                except (ProcessLookupError, OSError):
-                    try:
-                        self.process.kill()
-                        _ = self.process.wait(timeout=1)
-                    except:
-                        pass
-                except:
-                    pass
-            except:
-                pass
-            self.process = None
-
-    def _cleanup_all(self) -> None:
-        self._kill_process()
-        self.memory_logger.stop()
-
     def interrupt(self) -> None:
-        self.interrupted = True
-        self._cleanup_all()
+        with self.lock:
+            self.interrupted = True
+            processes = list(self.processes)
+            memory_loggers = list(self.memory_loggers)
+
+        _kill_process_groups(processes)
+        for memory_logger in memory_loggers:
+            memory_logger.stop()
 
 
 class TestRunner:
@@ -214,13 +310,24 @@ class TestRunner:
             template_vars: dict[str, str],
             config_generator: ConfigGenerator,
             execute_with: Execute,
+            max_parallel: int = 1,
+            force: bool = False,
     ):
+        if max_parallel > 1 and not execute_with.redirect_output:
+            raise ValueError("Experiments can only run in parallel when output is redirected to files")
+
         self.template_vars: dict[str, str] = template_vars
         self.config_generator: ConfigGenerator = config_generator
         self.failed_experiments: list[str] = []
         self.interrupted: bool = False
         self.cleanup_in_progress: bool = False
         self.executor: Execute = execute_with
+        self.max_parallel: int = max_parallel
+        # Rerun simulations even if they already completed with the same configs
+        self.force: bool = force
+        # Experiments and their variations are both dispatched concurrently; this caps
+        # how many simulations actually run at the same time
+        self.simulation_slots: threading.BoundedSemaphore = threading.BoundedSemaphore(max_parallel)
 
         _ = signal.signal(signal.SIGINT, self._signal_handler)
 
@@ -237,21 +344,34 @@ class TestRunner:
         print("Cleanup completed. Exiting...")
         sys.exit(1)
 
-    def run_simulation(self, exp_config_dir: Path, variation_name: str,
-                               extraparams: list[str], template_vars: dict[str, str]) -> bool:
+    def run_simulation(self, exp_config_dir: Path, variation_name: str, extraparams: list[str],
+                               template_vars: dict[str, str], base_config_files: list[Path]) -> bool:
         print(f"  Running simulation variation: {variation_name}")
 
         conf_path = self.config_generator.generate_network_config(exp_config_dir, variation_name, template_vars)
-        args_file = exp_config_dir / f'args-file.conf'
+        args_file = exp_config_dir / 'args-file.conf'
 
-        additional_args = [f'--args-file={str(args_file)}'] + extraparams + ['--', str(conf_path)]
-        output_dir = f"{exp_config_dir.name}/{variation_name}"
-        success = self.executor(output_dir, additional_args)
+        additional_args = [f'--args-file={args_file}'] + extraparams + ['--', str(conf_path)]
+        output_dir = Path(exp_config_dir.name, variation_name)
+
+        # A simulation that already completed with exactly these configs is not run again
+        digest = _config_digest(base_config_files + [conf_path], extraparams,
+                                self.executor.binary_path, self.executor.env_vars)
+        completion_marker = output_dir / f'{COMPLETION_MARKER_PREFIX}{digest}'
+        if completion_marker.exists() and not self.force:
+            print(f"    SKIPPED: Variation {variation_name} already completed with the same configs")
+            return True
+        for stale_marker in output_dir.glob(f'{COMPLETION_MARKER_PREFIX}*'):
+            stale_marker.unlink(missing_ok=True)
+
+        with self.simulation_slots:
+            success = self.executor(output_dir, additional_args)
 
         if not success:
             print(f"    FAILED: Variation {variation_name} failed to complete")
             return False
         else:
+            completion_marker.touch()
             print(f"    SUCCESS: Variation {variation_name} completed successfully")
             return True
 
@@ -259,6 +379,7 @@ class TestRunner:
         assert experiment.config_variations is None
 
         exp_config_dir = self.config_generator.generate_base_config(experiment, template_vars)
+        base_config_files = self.config_generator.base_config_files(exp_config_dir, experiment.jobs)
         exp_name = experiment.name
 
         print(f"Running single experiment for: {exp_name}")
@@ -268,7 +389,7 @@ class TestRunner:
         if self.interrupted:
             print("Experiment interrupted by user")
         else:
-            success = self.run_simulation(exp_config_dir, "exec_output", experiment.extraparams, template_vars)
+            success = self.run_simulation(exp_config_dir, "exec_output", experiment.extraparams, template_vars, base_config_files)
 
         if success:
             print("Successfully completed experiment")
@@ -281,20 +402,34 @@ class TestRunner:
         assert experiment.config_variations is not None
 
         exp_config_dir = self.config_generator.generate_base_config(experiment, template_vars)
+        base_config_files = self.config_generator.base_config_files(exp_config_dir, experiment.jobs)
         exp_name = experiment.name
 
         print(f"Running all simulation variations for: {exp_name}")
 
         failed_variations: list[str] = []
         successful_variations: list[str] = []
+        outcomes: list[tuple[str, bool]] = []
+
+        if self.max_parallel > 1:
+            # Each variation has its own network config and output directory, so they can run side by side
+            with ThreadPoolExecutor(max_workers=self.max_parallel) as pool:
+                futures = {
+                    variation_name: pool.submit(self.run_simulation, exp_config_dir, variation_name, experiment.extraparams, template_vars | overridding_vars, base_config_files)
+                    for variation_name, overridding_vars in experiment.config_variations.items()
+                }
+            outcomes = [(variation_name, future.result()) for variation_name, future in futures.items()]
+        else:
+            for variation_name, overridding_vars in experiment.config_variations.items():
+                # Check if we've been interrupted
+                if self.interrupted:
+                    print("Experiment interrupted by user")
+                    break
 
-        for variation_name, overridding_vars in experiment.config_variations.items():
-            # Check if we've been interrupted
-            if self.interrupted:
-                print("Experiment interrupted by user")
-                break
+                success = self.run_simulation(exp_config_dir, variation_name, experiment.extraparams, template_vars | overridding_vars, base_config_files)
+                outcomes.append((variation_name, success))
 
-            success = self.run_simulation(exp_config_dir, variation_name, experiment.extraparams, template_vars | overridding_vars)
+        for variation_name, success in outcomes:
             if success:
                 successful_variations.append(variation_name)
             else:
@@ -308,22 +443,36 @@ class TestRunner:
             print(f"  Failed variations: {', '.join(failed_variations)}")
         print("----------------------------------------")
 
+    def run_experiment(self, experiment: Experiment) -> None:
+        if experiment.config_variations is None:
+            self.run_single_experiment(experiment, self.template_vars)
+        else:
+            self.run_experiment_with_config_variations(experiment, self.template_vars)
+
     def run_tests(self, experiments: list[Experiment]) -> None:
         """Run all test experiments."""
         print("Starting Testing Suite")
         print("============================================")
 
         # Run all tests
-        for experiment in experiments:
-            # Check if we've been interrupted
-            if self.interrupted:
-                print("Test suite interrupted by user")
-                break
+        if self.max_parallel > 1:
+            # Every experiment writes to its own directory and every simulation gets its
+            # own environment and working directory, so experiments can run side by side
+            pool = ThreadPoolExecutor(max_workers=self.max_parallel)
+            try:
+                futures = [pool.submit(self.run_experiment, experiment) for experiment in experiments]
+                for future in futures:
+                    future.result()
+            finally:
+                pool.shutdown(cancel_futures=True)
+        else:
+            for experiment in experiments:
+                # Check if we've been interrupted
+                if self.interrupted:
+                    print("Test suite interrupted by user")
+                    break
 
-            if experiment.config_variations is None:
-                self.run_single_experiment(experiment, self.template_vars)
-            else:
-                self.run_experiment_with_config_variations(experiment, self.template_vars)
+                self.run_experiment(experiment)
 
         print("============================================")
         print("TEST SUITE COMPLETED")